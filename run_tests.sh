@@ -23,17 +23,22 @@ log_warn() {
 
 # Check if pytest is installed
 if ! command -v pytest &> /dev/null; then
-    log_error "pytest is not installed. Install with: pip install pytest pytest-cov"
+    log_error "pytest is not installed. Install with: pip install pytest pytest-cov pytest-xdist"
     exit 1
 fi
 
+# Run in parallel with pytest-xdist; loadfile keeps each file's tests
+# (and their class-scoped fixtures) on one worker. Not set in pytest.ini
+# so a bare pytest works without xdist and keeps live logging (log_cli).
+PARALLEL="-n auto --dist=loadfile"
+
 # Parse arguments
 TEST_TYPE=${1:-all}
 
 case $TEST_TYPE in
     unit)
         log_info "Running unit tests..."
-        pytest tests/ -m "not integration" -v
+        pytest $PARALLEL tests/ -m "not integration" -v
         ;;
     integration)
         log_info "Running integration tests..."
@@ -45,16 +50,16 @@ case $TEST_TYPE in
         ;;
     all)
         log_info "Running all tests..."
-        pytest tests/ -v
+        pytest $PARALLEL tests/ -v
         ;;
     coverage)
         log_info "Running tests with coverage..."
-        pytest tests/ --cov=trilio_dms --cov-report=html --cov-report=term-missing -v
+        pytest $PARALLEL tests/ --cov=trilio_dms --cov-report=html --cov-report=term-missing -v
         log_info "Coverage report generated in htmlcov/index.html"
         ;;
     client)
         log_info "Running client tests..."
-        pytest tests/test_client.py -v
+        pytest $PARALLEL tests/test_client.py -v
         ;;
     server)
         log_info "Running server tests..."
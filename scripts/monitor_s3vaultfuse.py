@@ -10,34 +10,47 @@ import time
 import argparse
 import psutil
 from datetime import datetime
-from tabulate import tabulate
+
+
+# One block per process in the detailed view
+_DETAIL_FMT = (
+    "PID: {pid}\n"
+    "  Mount Path: {mount_path}\n"
+    "  Status: {status}\n"
+    "  Uptime: {uptime}\n"
+    "  CPU: {cpu_percent:.1f}%\n"
+    "  Memory: {memory_mb:.1f} MB\n"
+    "  Started: {create_time:%Y-%m-%d %H:%M:%S}\n"
+    "\n"
+)
 
 
 def find_s3vaultfuse_processes():
     """Find all s3vaultfuse processes"""
     processes = []
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'create_time', 'cpu_percent', 'memory_info']):
+    # Only pid/cmdline are read for every process; the remaining stats are
+    # fetched for s3vaultfuse matches alone
+    for proc in psutil.process_iter(['pid', 'cmdline']):
         try:
-            cmdline = proc.info.get('cmdline', [])
-            if cmdline and 's3vaultfuse' in ' '.join(cmdline):
-                # Extract mount path from cmdline
-                mount_path = None
-                if len(cmdline) > 1:
-                    mount_path = cmdline[1]
-                
-                # Get process stats
-                create_time = datetime.fromtimestamp(proc.info['create_time'])
-                uptime = datetime.now() - create_time
-                
+            cmdline = proc.info.get('cmdline') or []
+            if not any('s3vaultfuse' in arg for arg in cmdline):
+                continue
+
+            # Extract mount path from cmdline
+            mount_path = cmdline[1] if len(cmdline) > 1 else None
+
+            with proc.oneshot():
+                create_time = datetime.fromtimestamp(proc.create_time())
+                memory_info = proc.memory_info()
                 processes.append({
                     'pid': proc.info['pid'],
-                    'name': proc.info['name'],
+                    'name': proc.name(),
                     'mount_path': mount_path,
                     'create_time': create_time,
-                    'uptime': str(uptime).split('.')[0],  # Remove microseconds
-                    'cpu_percent': proc.info.get('cpu_percent', 0),
-                    'memory_mb': proc.info['memory_info'].rss / 1024 / 1024 if proc.info.get('memory_info') else 0,
+                    'uptime': str(datetime.now() - create_time).split('.')[0],  # Remove microseconds
+                    'cpu_percent': proc.cpu_percent(),
+                    'memory_mb': memory_info.rss / 1024 / 1024 if memory_info else 0,
                     'status': proc.status()
                 })
         except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -58,18 +71,12 @@ def display_processes(processes, detailed=False):
     print(f"{'='*80}\n")
     
     if detailed:
-        # Detailed view
-        for proc in processes:
-            print(f"PID: {proc['pid']}")
-            print(f"  Mount Path: {proc['mount_path']}")
-            print(f"  Status: {proc['status']}")
-            print(f"  Uptime: {proc['uptime']}")
-            print(f"  CPU: {proc['cpu_percent']:.1f}%")
-            print(f"  Memory: {proc['memory_mb']:.1f} MB")
-            print(f"  Started: {proc['create_time'].strftime('%Y-%m-%d %H:%M:%S')}")
-            print()
+        # Detailed view, one write for all processes
+        fmt = _DETAIL_FMT.format
+        sys.stdout.writelines(fmt(**proc) for proc in processes)
     else:
-        # Table view
+        # Table view; tabulate is only needed here
+        from tabulate import tabulate
         headers = ['PID', 'Mount Path', 'Status', 'Uptime', 'CPU%', 'Memory(MB)']
         rows = []
         
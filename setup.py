@@ -2,12 +2,15 @@
 Setup configuration for Trilio DMS
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
-# Read README
+# Read README; sdists built without it still install
 def read_file(filename):
-    with open(os.path.join(os.path.dirname(__file__), filename), encoding='utf-8') as f:
+    path = os.path.join(os.path.dirname(__file__), filename)
+    if not os.path.exists(path):
+        return ''
+    with open(path, encoding='utf-8') as f:
         return f.read()
 
 setup(
@@ -21,7 +24,8 @@ setup(
     url='https://github.com/dhiraj-trilio/trilio-dms',
     license='Apache License 2.0',
     
-    packages=find_packages(exclude=['tests', 'tests.*', 'examples', 'examples.*']),
+    # Explicit package list; avoids the recursive find_packages() walk
+    packages=['trilio_dms'],
     
     install_requires=[
         'pika>=1.3.2',
@@ -39,6 +43,7 @@ setup(
             'pytest>=7.4.0',
             'pytest-cov>=4.1.0',
             'pytest-mock>=3.11.1',
+            'pytest-xdist>=3.3.1',
             'mock>=5.1.0',
             'black>=23.7.0',
             'flake8>=6.1.0',
@@ -48,6 +53,9 @@ setup(
             'gunicorn>=21.2.0',
             'supervisor>=4.2.5',
         ],
+        'fast': [
+            'orjson>=3.9.0',
+        ],
     },
     
     entry_points={
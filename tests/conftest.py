@@ -0,0 +1,68 @@
+"""
+Shared pytest fixtures for Trilio DMS tests
+"""
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from trilio_dms.models import Base
+
+
+@pytest.fixture(scope='session')
+def engine():
+    """In-memory SQLite engine with the ledger schema, created once per run"""
+    engine = create_engine(
+        'sqlite://',
+        connect_args={'check_same_thread': False},
+        poolclass=StaticPool
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+    @event.listens_for(engine, 'connect')
+    def _no_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """Session whose work is rolled back after each test
+
+    Runs inside an outer transaction with a SAVEPOINT that is restarted
+    whenever code under test commits or rolls back.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection)
+    session.begin_nested()
+
+    @event.listens_for(session, 'after_transaction_end')
+    def _restart_savepoint(sess, trans):
+        if trans.nested and not trans._parent.nested:
+            sess.begin_nested()
+
+    yield session
+
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def mock_pika_connection():
+    """Keep DMSClient from opening a real RabbitMQ connection
+
+    Opt-in: integration tests must still reach a real broker.
+    """
+    with patch('pika.BlockingConnection') as mock_connection:
+        yield mock_connection
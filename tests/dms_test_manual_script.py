@@ -3,8 +3,27 @@
 Trilio DMS Manual Test Scripts
 
 Individual test scripts for manual testing and validation.
+
+Set DMS_NONINTERACTIVE=1 to run a named test unattended with the
+default answers, e.g. DMS_NONINTERACTIVE=1 python dms_test_manual_script.py stress
 """
 
+import os
+import queue
+import sys
+import time
+from array import array
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _ask(prompt, default=''):
+    """Prompt for input, or return the default when DMS_NONINTERACTIVE is set"""
+    if os.environ.get('DMS_NONINTERACTIVE'):
+        return default
+    return input(prompt) or default
+
+
 # ==============================================================================
 # Script 1: Quick Configuration Check
 # ==============================================================================
@@ -44,15 +63,14 @@ def test_mount_unmount_single():
     print("="*60)
     
     from trilio_dms.client import DMSClient
-    import time
     
     client = DMSClient()
     
     # Test parameters
-    jobid = int(input("Enter Job ID (e.g., 12345): ") or "12345")
-    backup_target_id = input("Enter Backup Target ID (e.g., target-001): ") or "target-001"
-    host = input("Enter Host (e.g., compute-01): ") or "compute-01"
-    mount_path = input("Enter Mount Path (e.g., /mnt/target-001): ") or f"/mnt/{backup_target_id}"
+    jobid = int(_ask("Enter Job ID (e.g., 12345): ", "12345"))
+    backup_target_id = _ask("Enter Backup Target ID (e.g., target-001): ", "target-001")
+    host = _ask("Enter Host (e.g., compute-01): ", "compute-01")
+    mount_path = _ask("Enter Mount Path (e.g., /mnt/target-001): ", f"/mnt/{backup_target_id}")
     
     request = {
         'job': {'jobid': jobid},
@@ -84,7 +102,7 @@ def test_mount_unmount_single():
         print(f"   ✗ No ledger entry found")
     
     # Wait
-    input("\nPress Enter to unmount...")
+    _ask("\nPress Enter to unmount...")
     
     # Unmount
     print(f"\n3. Unmounting target {backup_target_id}...")
@@ -122,29 +140,28 @@ def test_concurrent_jobs_manual():
     
     client = DMSClient()
     
-    backup_target_id = input("Enter Backup Target ID (e.g., shared-target): ") or "shared-target"
-    host = input("Enter Host (e.g., compute-01): ") or "compute-01"
+    backup_target_id = _ask("Enter Backup Target ID (e.g., shared-target): ", "shared-target")
+    host = _ask("Enter Host (e.g., compute-01): ", "compute-01")
     mount_path = f"/mnt/{backup_target_id}"
     
-    num_jobs = int(input("How many jobs? (e.g., 3): ") or "3")
+    num_jobs = int(_ask("How many jobs? (e.g., 3): ", "3"))
     
     job_ids = []
     for i in range(num_jobs):
-        jobid = int(input(f"Enter Job ID #{i+1} (e.g., {10001+i}): ") or str(10001+i))
+        jobid = int(_ask(f"Enter Job ID #{i+1} (e.g., {10001+i}): ", str(10001+i)))
         job_ids.append(jobid)
     
+    # Shared by every request; DMSClient only sets 'action' on the outer dict
+    backup_target = {
+        'id': backup_target_id,
+        'type': 's3',
+        'filesystem_export_mount_path': mount_path
+    }
+    
     # Mount from all jobs
     print(f"\n1. Mounting from {num_jobs} jobs...")
     for jobid in job_ids:
-        request = {
-            'job': {'jobid': jobid},
-            'backup_target': {
-                'id': backup_target_id,
-                'type': 's3',
-                'filesystem_export_mount_path': mount_path
-            },
-            'host': host
-        }
+        request = {'job': {'jobid': jobid}, 'backup_target': backup_target, 'host': host}
         
         response = client.mount(request)
         print(f"   Job {jobid}: {response['status']} (reused={response.get('reused_existing')})")
@@ -158,17 +175,9 @@ def test_concurrent_jobs_manual():
     
     # Unmount one by one
     for i, jobid in enumerate(job_ids):
-        input(f"\nPress Enter to unmount job {jobid} ({i+1}/{num_jobs})...")
+        _ask(f"\nPress Enter to unmount job {jobid} ({i+1}/{num_jobs})...")
         
-        request = {
-            'job': {'jobid': jobid},
-            'backup_target': {
-                'id': backup_target_id,
-                'type': 's3',
-                'filesystem_export_mount_path': mount_path
-            },
-            'host': host
-        }
+        request = {'job': {'jobid': jobid}, 'backup_target': backup_target, 'host': host}
         
         response = client.unmount(request)
         print(f"   Job {jobid}: {response['status']}")
@@ -193,87 +202,108 @@ def test_stress():
     print("Stress Test")
     print("="*60)
     
-    import threading
-    import time
     from trilio_dms.client import DMSClient
     
-    num_threads = int(input("Number of concurrent threads (e.g., 10): ") or "10")
-    operations_per_thread = int(input("Operations per thread (e.g., 5): ") or "5")
+    num_threads = int(_ask("Number of concurrent threads (e.g., 10): ", "10"))
+    operations_per_thread = int(_ask("Operations per thread (e.g., 5): ", "5"))
     
     print(f"\nStarting stress test:")
     print(f"  Threads: {num_threads}")
     print(f"  Operations per thread: {operations_per_thread}")
     print(f"  Total operations: {num_threads * operations_per_thread}")
     
-    results = {'success': 0, 'error': 0}
-    lock = threading.Lock()
+    # Per-op latency in ns; each worker writes only its own slice
+    latencies = array('q', [0]) * (num_threads * operations_per_thread)
+    
+    # Build one client per thread up front so connection setup (DB engine,
+    # AMQP handshake) happens outside the timed section
+    pool = queue.Queue()
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for client in executor.map(lambda _: DMSClient(), range(num_threads)):
+            pool.put(client)
     
     def worker(worker_id):
-        client = DMSClient()
-        
-        for op in range(operations_per_thread):
-            try:
-                jobid = worker_id * 1000 + op
-                
-                request = {
-                    'job': {'jobid': jobid},
-                    'backup_target': {
-                        'id': f'stress-target-{worker_id}',
-                        'type': 's3',
-                        'filesystem_export_mount_path': f'/mnt/stress-{worker_id}'
-                    },
-                    'host': 'stress-host'
-                }
-                
-                # Mount
-                mount_resp = client.mount(request)
-                # Small delay
-                time.sleep(0.1)
-                # Unmount
-                unmount_resp = client.unmount(request)
-                
-                if mount_resp['status'] == 'success' and unmount_resp['status'] == 'success':
-                    with lock:
-                        results['success'] += 1
-                else:
-                    with lock:
-                        results['error'] += 1
-                        
-            except Exception as e:
-                with lock:
-                    results['error'] += 1
-                print(f"Worker {worker_id}: Error on op {op}: {e}")
-        
-        client.close()
+        """Run this worker's operations and return its (success, error) counts"""
+        success = error = 0
+        client = pool.get()
+        # Built once per worker; only the job id changes between operations
+        request = {
+            'job': {'jobid': None},
+            'backup_target': {
+                'id': f'stress-target-{worker_id}',
+                'type': 's3',
+                'filesystem_export_mount_path': f'/mnt/stress-{worker_id}'
+            },
+            'host': 'stress-host'
+        }
+        job_ids = range(worker_id * 1000, worker_id * 1000 + operations_per_thread)
+        try:
+            for op, jobid in enumerate(job_ids):
+                # Only the mount() and unmount() calls are timed, not the delay
+                op_ns = 0
+                try:
+                    request['job']['jobid'] = jobid
+                    
+                    # Mount
+                    call_start = time.perf_counter_ns()
+                    mount_resp = client.mount(request)
+                    op_ns += time.perf_counter_ns() - call_start
+                    # Small delay
+                    time.sleep(0.1)
+                    # Unmount
+                    call_start = time.perf_counter_ns()
+                    unmount_resp = client.unmount(request)
+                    op_ns += time.perf_counter_ns() - call_start
+                    
+                    if mount_resp['status'] == 'success' and unmount_resp['status'] == 'success':
+                        success += 1
+                    else:
+                        error += 1
+                            
+                except Exception as e:
+                    error += 1
+                    print(f"Worker {worker_id}: Error on op {op}: {e}")
+                latencies[worker_id * operations_per_thread + op] = op_ns
+        finally:
+            pool.put(client)
+        return success, error
     
     # Start test
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    threads = []
-    for i in range(num_threads):
-        t = threading.Thread(target=worker, args=(i,))
-        threads.append(t)
-        t.start()
+    # Workers count locally; totals are merged here instead of under a lock
+    results = {'success': 0, 'error': 0}
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        for success, error in executor.map(worker, range(num_threads)):
+            results['success'] += success
+            results['error'] += error
     
-    # Wait for completion
-    for t in threads:
-        t.join()
+    elapsed = time.perf_counter() - start_time
     
-    elapsed = time.time() - start_time
+    while not pool.empty():
+        pool.get().close()
     
-    # Results
+    # Results, written in one go
     total = results['success'] + results['error']
-    print(f"\nStress Test Results:")
-    print(f"  Total operations: {total}")
-    print(f"  Successful: {results['success']} ({results['success']/total*100:.1f}%)")
-    print(f"  Errors: {results['error']} ({results['error']/total*100:.1f}%)")
-    print(f"  Time elapsed: {elapsed:.2f} seconds")
-    print(f"  Operations/second: {total/elapsed:.2f}")
+    lines = [
+        "\nStress Test Results:",
+        f"  Total operations: {total}",
+        f"  Successful: {results['success']} ({results['success']/total*100:.1f}%)",
+        f"  Errors: {results['error']} ({results['error']/total*100:.1f}%)",
+        f"  Time elapsed: {elapsed:.2f} seconds",
+        f"  Operations/second: {total/elapsed:.2f}",
+    ]
+    
+    ordered = sorted(latencies)
+    for label, pct in (('p50', 50), ('p95', 95), ('p99', 99)):
+        idx = min(len(ordered) - 1, len(ordered) * pct // 100)
+        lines.append(f"  Mount+unmount latency {label}: {ordered[idx] / 1e6:.1f} ms")
     
     if results['error'] == 0:
-        print("\n✓ All operations successful!")
+        lines.append("\n✓ All operations successful!")
     else:
-        print(f"\n⚠ {results['error']} operations failed")
+        lines.append(f"\n⚠ {results['error']} operations failed")
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 
 # ==============================================================================
@@ -298,22 +328,20 @@ def check_active_mounts():
         client.close()
         return
     
-    print(f"\nFound {len(active)} active mount(s):\n")
-    
     # Group by target
-    by_target = {}
+    by_target = defaultdict(list)
     for mount in active:
-        target_id = mount.backup_target_id
-        if target_id not in by_target:
-            by_target[target_id] = []
-        by_target[target_id].append(mount)
+        by_target[mount.backup_target_id].append(mount)
     
+    # Build the whole report and write it once
+    lines = [f"\nFound {len(active)} active mount(s):\n"]
     for target_id, mounts in by_target.items():
-        print(f"Target: {target_id}")
-        print(f"  Active mounts: {len(mounts)}")
+        lines.append(f"Target: {target_id}")
+        lines.append(f"  Active mounts: {len(mounts)}")
         for mount in mounts:
-            print(f"    - Job {mount.jobid} on {mount.host}")
-        print()
+            lines.append(f"    - Job {mount.jobid} on {mount.host}")
+        lines.append('')
+    sys.stdout.write('\n'.join(lines) + '\n')
     
     client.close()
 
@@ -335,27 +363,39 @@ def cleanup_test_data():
     session = client.SessionLocal()
     
     # Find test entries (jobid > 9000 are test jobs)
-    test_entries = session.query(BackupTargetMountLedger).filter(
-        BackupTargetMountLedger.jobid >= 9000
-    ).all()
+    test_filter = BackupTargetMountLedger.jobid >= 9000
+    total = session.query(BackupTargetMountLedger).filter(test_filter).count()
     
-    if not test_entries:
+    if not total:
         print("\nNo test data found (jobid >= 9000)")
         session.close()
         client.close()
         return
     
-    print(f"\nFound {len(test_entries)} test entries:")
-    for entry in test_entries:
-        print(f"  - Job {entry.jobid}: {entry.backup_target_id} on {entry.host}")
+    # Preview only the columns we print, capped so large leftovers
+    # don't get materialized as ORM objects
+    preview_limit = 50
+    preview = session.query(
+        BackupTargetMountLedger.jobid,
+        BackupTargetMountLedger.backup_target_id,
+        BackupTargetMountLedger.host
+    ).filter(test_filter).limit(preview_limit).all()
+    
+    print(f"\nFound {total} test entries:")
+    for jobid, backup_target_id, host in preview:
+        print(f"  - Job {jobid}: {backup_target_id} on {host}")
+    if total > preview_limit:
+        print(f"  ... and {total - preview_limit} more")
     
-    confirm = input("\nDelete these entries? (yes/no): ")
+    # Never deletes unattended
+    confirm = _ask("\nDelete these entries? (yes/no): ", "no")
     
     if confirm.lower() == 'yes':
-        for entry in test_entries:
-            session.delete(entry)
+        deleted = session.query(BackupTargetMountLedger).filter(
+            test_filter
+        ).delete(synchronize_session=False)
         session.commit()
-        print(f"\n✓ Deleted {len(test_entries)} test entries")
+        print(f"\n✓ Deleted {deleted} test entries")
     else:
         print("\nCancelled")
     
@@ -367,6 +407,18 @@ def cleanup_test_data():
 # Main Menu
 # ==============================================================================
 
+# Test name -> function; menu options 1..6 follow this order
+_TESTS = {
+    'config': test_config_quick,
+    'mount': test_mount_unmount_single,
+    'concurrent': test_concurrent_jobs_manual,
+    'stress': test_stress,
+    'active': check_active_mounts,
+    'cleanup': cleanup_test_data,
+}
+_MENU = {str(i): fn for i, fn in enumerate(_TESTS.values(), 1)}
+
+
 def main_menu():
     """Show main menu"""
     while True:
@@ -383,21 +435,13 @@ def main_menu():
         
         choice = input("\nSelect option: ")
         
-        if choice == '1':
-            test_config_quick()
-        elif choice == '2':
-            test_mount_unmount_single()
-        elif choice == '3':
-            test_concurrent_jobs_manual()
-        elif choice == '4':
-            test_stress()
-        elif choice == '5':
-            check_active_mounts()
-        elif choice == '6':
-            cleanup_test_data()
-        elif choice == '0':
+        if choice == '0':
             print("\nExiting...")
             break
+        
+        test_fn = _MENU.get(choice)
+        if test_fn:
+            test_fn()
         else:
             print("\nInvalid option")
         
@@ -405,26 +449,15 @@ def main_menu():
 
 
 if __name__ == '__main__':
-    import sys
-    
     if len(sys.argv) > 1:
         # Run specific test
         test_name = sys.argv[1]
-        if test_name == 'config':
-            test_config_quick()
-        elif test_name == 'mount':
-            test_mount_unmount_single()
-        elif test_name == 'concurrent':
-            test_concurrent_jobs_manual()
-        elif test_name == 'stress':
-            test_stress()
-        elif test_name == 'active':
-            check_active_mounts()
-        elif test_name == 'cleanup':
-            cleanup_test_data()
+        test_fn = _TESTS.get(test_name)
+        if test_fn:
+            test_fn()
         else:
             print(f"Unknown test: {test_name}")
-            print("Available: config, mount, concurrent, stress, active, cleanup")
+            print(f"Available: {', '.join(_TESTS)}")
     else:
         # Show menu
         main_menu()
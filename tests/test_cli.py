@@ -0,0 +1,50 @@
+"""
+Unit tests for DMS CLI output helpers
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from trilio_dms import cli
+from trilio_dms.models import BackupTargetMountLedger
+
+
+LEDGER = BackupTargetMountLedger(
+    jobid=1001,
+    backup_target_id='target-123',
+    host='compute-01',
+    mounted=True,
+    deleted=False,
+    created_at=datetime(2024, 1, 2, 3, 4, 5, 678901),
+    updated_at=None,
+    deleted_at=datetime(2024, 1, 2),
+    version='1.0.0'
+)
+
+EXPECTED_JSON = '''[
+  {
+    "jobid": 1001,
+    "backup_target_id": "target-123",
+    "host": "compute-01",
+    "mounted": true,
+    "deleted": false,
+    "created_at": "2024-01-02T03:04:05.678901",
+    "updated_at": null,
+    "deleted_at": "2024-01-02T00:00:00",
+    "version": "1.0.0"
+  }
+]'''
+
+
+def test_dumps_stdlib_format():
+    """Test JSON output without orjson"""
+    with patch.object(cli, 'orjson', None):
+        assert cli._dumps([LEDGER.to_dict()]) == EXPECTED_JSON
+
+
+def test_dumps_orjson_format():
+    """Test JSON output with orjson matches the stdlib output"""
+    orjson = pytest.importorskip('orjson')
+    with patch.object(cli, 'orjson', orjson):
+        assert cli._dumps([LEDGER.to_dict()]) == EXPECTED_JSON
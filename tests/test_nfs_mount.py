@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 """
 Test script for real NFS mount with proper error handling and diagnostics
+
+Prompts only when stdin is a terminal; use --auto-unmount and
+--skip-final-unmount to run unattended. The Keystone token is read from
+KEYSTONE_TOKEN, or prompted for without echo.
 """
 
+import argparse
+import getpass
 import logging
+import os
 import sys
 import traceback
 
+from trilio_dms.config import DMSConfig
+from trilio_dms.client import DMSClient
+
 # Setup detailed logging
 logging.basicConfig(
     level=logging.DEBUG,
@@ -14,6 +24,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument('--auto-unmount', action='store_true',
+                    help='Unmount without prompting (existing and final mount)')
+parser.add_argument('--skip-final-unmount', action='store_true',
+                    help='Leave the target mounted at the end')
+# Tolerate foreign arguments, e.g. when collected by pytest
+args, _ = parser.parse_known_args()
+
+
+def confirm(prompt, auto):
+    """Return True if auto is set, else ask; never blocks without a terminal"""
+    if auto:
+        return True
+    if not sys.stdin.isatty():
+        return False
+    return input(prompt).lower() == 'yes'
+
+
 print("="*70)
 print("DMS Client NFS Mount Test")
 print("="*70)
@@ -21,7 +49,6 @@ print("="*70)
 # Step 1: Load configuration
 print("\n1. Loading configuration...")
 try:
-    from trilio_dms.config import DMSConfig
     DMSConfig.load_config(config_type='client')
     
     print(f"   ✓ Config loaded")
@@ -35,7 +62,6 @@ except Exception as e:
 # Step 2: Initialize client
 print("\n2. Initializing DMS Client...")
 try:
-    from trilio_dms.client import DMSClient
     client = DMSClient()
     print(f"   ✓ Client initialized")
     print(f"   - Using DB: {DMSConfig._mask_password(client.db_url)}")
@@ -47,8 +73,15 @@ except Exception as e:
 
 # Step 3: Prepare request
 print("\n3. Preparing mount request...")
+token = os.environ.get('KEYSTONE_TOKEN')
+if not token and sys.stdin.isatty():
+    token = getpass.getpass("   Keystone token: ")
+if not token:
+    print("   ✗ No Keystone token; set KEYSTONE_TOKEN")
+    sys.exit(1)
+
 request = {
-    'keystone_token': 'gAAAAABpai8dVCu3F-nAlje4V1-IAyvTecF_zMYBkOgJ-ie0IUBiMr6spj6nU4VYvXix8QffXjqfnMSoNAuc4brYNNGiXhD4glZR4SkBkm9ney-5Jc2_YdlZ9iF3VIVlmSe3JTBnblo_zsRDD9u0p3ufpNB5V3G-qZlUrr04Ry-otE6ETUOsGOA',
+    'keystone_token': token,
     'context': {'tenant_id': '12345'},
     'job': {
         'jobid': 1,
@@ -98,8 +131,7 @@ try:
         
         if ledger.mounted:
             print(f"   ⚠ Target already mounted for this job")
-            unmount_first = input("   Unmount first? (yes/no): ")
-            if unmount_first.lower() == 'yes':
+            if confirm("   Unmount first? (yes/no): ", args.auto_unmount):
                 print("   Unmounting...")
                 unmount_response = client.unmount(request)
                 print(f"   Unmount status: {unmount_response['status']}")
@@ -144,22 +176,23 @@ try:
     else:
         print(f"   ✗ FAILED")
         print(f"   - Error: {response.get('error_msg')}")
+        err = (response.get('error_msg') or '').lower()
         
         # Check if it's a validation error
-        if 'Missing required field' in response.get('error_msg', ''):
+        if 'missing required field' in err:
             print(f"\n   Troubleshooting:")
             print(f"   - Check that all required fields are in request")
             print(f"   - Verify utils.validate_request_structure() expectations")
         
         # Check if it's a RabbitMQ error
-        if 'timeout' in response.get('error_msg', '').lower():
+        if 'timeout' in err:
             print(f"\n   Troubleshooting:")
             print(f"   - Is DMS Server running? (trilio-dms-server)")
             print(f"   - Check queue: dms.{request['host']}")
             print(f"   - Verify RabbitMQ connectivity")
         
         # Check if it's a lock error
-        if 'lock' in response.get('error_msg', '').lower():
+        if 'lock' in err:
             print(f"\n   Troubleshooting:")
             print(f"   - Another process may be holding the lock")
             print(f"   - Check /var/lock/trilio-dms/")
@@ -187,24 +220,11 @@ try:
 except Exception as e:
     print(f"   ✗ Error checking ledger: {e}")
 
-# Step 8: Cleanup
-print("\n8. Cleanup...")
-try:
-    client.close()
-    print(f"   ✓ Client closed")
-except Exception as e:
-    print(f"   ✗ Error closing client: {e}")
-
-print("\n" + "="*70)
-print("Test Complete")
-print("="*70)
-
 # Prompt for unmount
-unmount = input("\nDo you want to unmount? (yes/no): ")
-if unmount.lower() == 'yes':
+if not args.skip_final_unmount and confirm(
+        "\nDo you want to unmount? (yes/no): ", args.auto_unmount):
     print("\nUnmounting...")
     try:
-        client = DMSClient()
         response = client.unmount(request)
         
         print(f"Unmount Response:")
@@ -216,8 +236,18 @@ if unmount.lower() == 'yes':
             print(f"  - Remaining Mounts: {response.get('active_mounts_remaining')}")
         else:
             print(f"  ✗ {response.get('error_msg')}")
-        
-        client.close()
     except Exception as e:
         print(f"  ✗ Unmount failed: {e}")
         traceback.print_exc()
+
+# Step 8: Cleanup
+print("\n8. Cleanup...")
+try:
+    client.close()
+    print(f"   ✓ Client closed")
+except Exception as e:
+    print(f"   ✗ Error closing client: {e}")
+
+print("\n" + "="*70)
+print("Test Complete")
+print("="*70)
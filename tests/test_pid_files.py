@@ -61,7 +61,19 @@ class TestPIDFiles(unittest.TestCase):
         # Read PID file
         read_pid = self.manager._read_pid_file(target_id)
         self.assertEqual(read_pid, pid)
-    
+
+    def test_write_pid_file_failure_removes_tmp(self):
+        """Test a failed write leaves neither the PID file nor its temp file"""
+        target_id = 'target-123'
+        pid_file = self.manager._get_pid_file_path(target_id)
+
+        with patch('os.replace', side_effect=OSError('disk full')):
+            success = self.manager._write_pid_file(target_id, 12345)
+
+        self.assertFalse(success)
+        self.assertFalse(os.path.exists(pid_file))
+        self.assertFalse(os.path.exists(f"{pid_file}.tmp"))
+
     def test_delete_pid_file(self):
         """Test deleting PID files"""
         target_id = 'target-123'
@@ -125,7 +125,7 @@ def db_session():
 
 
 @pytest.fixture
-def dms_client(db_session, temp_lock_dir):
+def dms_client(db_session, temp_lock_dir, mock_pika_connection):
     """Create DMS client with test configuration."""
     client = DMSClient(
         rabbitmq_url='amqp://test',
@@ -0,0 +1,85 @@
+"""
+Unit tests for DMS utilities
+"""
+
+import errno
+import os
+import subprocess
+import pytest
+from unittest.mock import patch
+from trilio_dms import utils
+
+
+def mounts_line(path):
+    """A /proc/mounts line for path, escaped the way the kernel does"""
+    field = path.replace('\\', '\\134').replace(' ', '\\040').replace('\t', '\\011')
+    return f"s3vaultfuse {field} fuse rw,nosuid,nodev 0 0\n"
+
+
+@pytest.fixture
+def mounted_dir(tmp_path, monkeypatch):
+    """A directory with a space in its name listed in a fake mounts file"""
+    target = tmp_path / 'backup target'
+    target.mkdir()
+    real = os.path.realpath(str(target))
+
+    proc_mounts = tmp_path / 'mounts'
+    proc_mounts.write_text(
+        "proc /proc proc rw,nosuid,nodev,noexec 0 0\n" + mounts_line(real)
+    )
+    monkeypatch.setattr(utils, '_PROC_MOUNTS', str(proc_mounts))
+    return real
+
+
+class TestIsMounted:
+    """Test cases for is_mounted"""
+
+    def test_escaped_space(self, mounted_dir, tmp_path):
+        """Test octal escapes in the mounts file are decoded"""
+        other = tmp_path / 'other'
+        other.mkdir()
+
+        assert mounted_dir in utils._read_mountpoints()
+        assert utils.is_mounted(mounted_dir) is True
+        assert utils.is_mounted(str(other)) is False
+
+    def test_symlinked_path(self, mounted_dir, tmp_path):
+        """Test a symlink to a mountpoint is resolved before the lookup"""
+        link = tmp_path / 'link'
+        link.symlink_to(mounted_dir)
+
+        assert utils.is_mounted(str(link)) is True
+
+    def test_missing_path(self, mounted_dir, tmp_path):
+        """Test a path that does not exist is never mounted"""
+        with patch('subprocess.run') as run:
+            assert utils.is_mounted(str(tmp_path / 'missing')) is False
+        run.assert_not_called()
+
+    def test_unreadable_mounts_falls_back(self, tmp_path, monkeypatch):
+        """Test mountpoint(1) is used when the mounts file cannot be read"""
+        monkeypatch.setattr(utils, '_PROC_MOUNTS', str(tmp_path / 'no-such-file'))
+        assert utils._read_mountpoints() is None
+
+        done = subprocess.CompletedProcess(['mountpoint'], 0, b'', b'')
+        with patch('subprocess.run', return_value=done) as run:
+            assert utils.is_mounted(str(tmp_path)) is True
+
+        run.assert_called_once()
+        assert run.call_args.args[0] == ['mountpoint', '-q', str(tmp_path)]
+
+
+class TestIsMountStale:
+    """Test cases for is_mount_stale"""
+
+    def test_dead_mountpoint(self, mounted_dir):
+        """Test ENOTCONN is stale but still counts as mounted for unmount"""
+        dead = OSError(errno.ENOTCONN, os.strerror(errno.ENOTCONN), mounted_dir)
+        with patch('os.lstat', side_effect=dead):
+            assert utils.is_mount_stale(mounted_dir) is True
+            assert utils.is_mounted(mounted_dir) is True
+
+    def test_healthy_and_missing(self, mounted_dir, tmp_path):
+        """Test healthy and missing paths are not stale"""
+        assert utils.is_mount_stale(mounted_dir) is False
+        assert utils.is_mount_stale(str(tmp_path / 'missing')) is False
@@ -27,31 +27,39 @@ Example:
     ...     perform_backup(mount['mount_path'])
 """
 
-from .client import (
-    DMSClient,
-    DMSClientError,
-    DMSMountError,
-    DMSUnmountError,
-    DMSLockTimeoutError,
-    MountContext
-)
-
-from .lock_manager import (
-    DMSLockManager,
-    get_lock_manager
-)
-
-from .models import (
-    BackupTargetMountLedger,
-    Base
-)
-
-from .context_manager import (
-    mount_context,
-    batch_mount_context,
-    MountContext,
-    auto_mount_unmount
-)
+import importlib
+
+# Public names resolved on first access, so that importing a submodule
+# (e.g. the CLI entry point) does not pull in pika and SQLAlchemy
+_LAZY_EXPORTS = {
+    'DMSClient': '.client',
+    'DMSClientError': '.client',
+    'DMSMountError': '.client',
+    'DMSUnmountError': '.client',
+    'DMSLockTimeoutError': '.client',
+    'DMSLockManager': '.lock_manager',
+    'get_lock_manager': '.lock_manager',
+    'BackupTargetMountLedger': '.models',
+    'Base': '.models',
+    'mount_context': '.context_manager',
+    'batch_mount_context': '.context_manager',
+    'MountContext': '.context_manager',
+    'auto_mount_unmount': '.context_manager',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __version__ = '1.0.0'
 __author__ = 'Trilio Data'
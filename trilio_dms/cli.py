@@ -6,9 +6,36 @@ import click
 import json
 import sys
 from datetime import datetime
-from tabulate import tabulate
-from trilio_dms.client import DMSClient
-from trilio_dms.config import DMSConfig
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up --format json
+    orjson = None
+
+
+def _dumps(data):
+    """Serialize data as indented JSON, using orjson when available
+
+    Both paths produce identical text: naive datetimes stay offset-free
+    and non-ASCII is written as-is.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data, default=_json_default, option=orjson.OPT_INDENT_2
+        ).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+
+
+def _json_default(value):
+    """Serialize datetimes (and anything else unknown) for stdlib json"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _timestamp(value):
+    """Format a ledger datetime for table output"""
+    return value.isoformat(sep=' ', timespec='seconds') if value else ''
 
 
 @click.group()
@@ -18,7 +45,14 @@ from trilio_dms.config import DMSConfig
 def cli(ctx, db_url, rabbitmq_url):
     """Trilio Dynamic Mount Service CLI"""
     ctx.ensure_object(dict)
-    ctx.obj['client'] = DMSClient(db_url=db_url, rabbitmq_url=rabbitmq_url)
+    ctx.obj['db_url'] = db_url
+    ctx.obj['rabbitmq_url'] = rabbitmq_url
+
+
+def _get_client(ctx):
+    """Build a DMSClient from the group options"""
+    from trilio_dms.client import DMSClient
+    return DMSClient(db_url=ctx.obj['db_url'], rabbitmq_url=ctx.obj['rabbitmq_url'])
 
 
 @cli.command()
@@ -33,7 +67,7 @@ def cli(ctx, db_url, rabbitmq_url):
 @click.pass_context
 def mount(ctx, job_id, target_id, target_type, host, token, secret_ref, nfs_export, nfs_opts):
     """Mount a backup target"""
-    client = ctx.obj['client']
+    client = _get_client(ctx)
     
     # Build request
     request = {
@@ -87,7 +121,7 @@ def mount(ctx, job_id, target_id, target_type, host, token, secret_ref, nfs_expo
 @click.pass_context
 def unmount(ctx, job_id, target_id, target_type, host, token):
     """Unmount a backup target"""
-    client = ctx.obj['client']
+    client = _get_client(ctx)
     
     request = {
         'context': {'user_id': 'cli-user'},
@@ -131,7 +165,8 @@ def unmount(ctx, job_id, target_id, target_type, host, token):
 @click.pass_context
 def status(ctx, job_id, target_id):
     """Get mount status"""
-    client = ctx.obj['client']
+    from tabulate import tabulate
+    client = _get_client(ctx)
     
     try:
         result = client.get_mount_status(job_id, target_id)
@@ -165,35 +200,33 @@ def status(ctx, job_id, target_id):
 
 
 @cli.command()
-@click.option('--host', help='Filter by host')
+@click.option('--host', multiple=True, help='Filter by host (repeatable)')
 @click.option('--format', 'output_format', type=click.Choice(['table', 'json']), default='table')
+@click.option('--limit', type=int, help='Show only the N most recent mounts')
 @click.pass_context
-def list_mounts(ctx, host, output_format):
+def list_mounts(ctx, host, output_format, limit):
     """List active mounts"""
-    client = ctx.obj['client']
+    from tabulate import tabulate
+    client = _get_client(ctx)
     
     try:
-        mounts = client.get_active_mounts(host)
+        mounts = client.get_active_mounts(list(host) or None, limit=limit)
         
         if output_format == 'json':
             data = [m.to_dict() for m in mounts]
-            click.echo(json.dumps(data, indent=2))
+            click.echo(_dumps(data))
         else:
             if mounts:
-                data = []
-                for m in mounts:
-                    data.append([
-                        m.id[:8] + '...',
-                        m.backup_target_id,
-                        m.job_id[:12] + '...',
-                        m.host,
-                        m.mount_path,
-                        m.created_at.strftime('%Y-%m-%d %H:%M:%S')
-                    ])
-                
-                headers = ['ID', 'Target', 'Job', 'Host', 'Path', 'Mounted']
-                click.echo(tabulate(data, headers=headers, tablefmt='grid'))
-                click.echo(f"\nTotal: {len(mounts)} active mounts")
+                rows = (
+                    (m.backup_target_id, m.jobid, m.host, _timestamp(m.created_at))
+                    for m in mounts
+                )
+                headers = ['Target', 'Job', 'Host', 'Mounted']
+                click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
+                if limit and len(mounts) >= limit:
+                    click.echo(f"\nShowing the {len(mounts)} most recent active mounts (--limit {limit})")
+                else:
+                    click.echo(f"\nTotal: {len(mounts)} active mounts")
             else:
                 click.echo("No active mounts found")
     except Exception as e:
@@ -209,25 +242,19 @@ def list_mounts(ctx, host, output_format):
 @click.pass_context
 def history(ctx, target_id, limit):
     """Show mount/unmount history for a target"""
-    client = ctx.obj['client']
+    from tabulate import tabulate
+    client = _get_client(ctx)
     
     try:
         entries = client.get_ledger_history(target_id, limit)
         
         if entries:
-            data = []
-            for e in entries:
-                data.append([
-                    e.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                    e.action,
-                    e.status,
-                    e.job_id[:12] + '...',
-                    e.host,
-                    (e.success_msg or e.error_msg or '')[:40]
-                ])
-            
-            headers = ['Time', 'Action', 'Status', 'Job', 'Host', 'Message']
-            click.echo(tabulate(data, headers=headers, tablefmt='grid'))
+            rows = (
+                (_timestamp(e.created_at), e.jobid, e.host, e.mounted, e.deleted)
+                for e in entries
+            )
+            headers = ['Time', 'Job', 'Host', 'Mounted', 'Deleted']
+            click.echo(tabulate(rows, headers=headers, tablefmt='grid'))
             click.echo(f"\nTotal: {len(entries)} entries")
         else:
             click.echo("No history found")
@@ -243,7 +270,7 @@ def history(ctx, target_id, limit):
 @click.pass_context
 def cleanup(ctx, hours):
     """Cleanup stale pending entries"""
-    client = ctx.obj['client']
+    client = _get_client(ctx)
     
     try:
         click.echo(f"Cleaning up entries older than {hours} hours...")
@@ -4,11 +4,13 @@ Trilio DMS Client - Database and RabbitMQ Client with Global Locking
 
 import json
 import logging
+import time
 import uuid
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional, List, Sequence, Union
 from datetime import datetime, timedelta
 import pika
-from sqlalchemy import create_engine, and_
+from sqlalchemy import bindparam, create_engine, or_, select
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -20,7 +22,7 @@ from trilio_dms.exceptions import (
 )
 from trilio_dms.utils import (
     validate_request_structure, create_response,
-    safe_json_dumps, safe_json_loads
+    safe_json_dumps, safe_json_loads, dumps_message, loads_message
 )
 from trilio_dms.lock_manager import get_lock_manager, DMSLockManager
 
@@ -30,6 +32,67 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Base statement for active-mount listings; filters are added per call
+_ACTIVE_MOUNTS_STMT = select(BackupTargetMountLedger).where(
+    BackupTargetMountLedger.mounted == True
+)
+
+# Ledger lookups built once; per-call values are bound by name so the
+# compiled SQL is reused from SQLAlchemy's statement cache
+_MOUNTED_ON_HOST_STMT = select(BackupTargetMountLedger).where(
+    BackupTargetMountLedger.backup_target_id == bindparam('backup_target_id'),
+    BackupTargetMountLedger.host == bindparam('host'),
+    BackupTargetMountLedger.mounted == True
+)
+# This job's row on the host (mounted or not) plus every active mount there
+_MOUNT_CHECK_STMT = select(BackupTargetMountLedger).where(
+    BackupTargetMountLedger.backup_target_id == bindparam('backup_target_id'),
+    BackupTargetMountLedger.host == bindparam('host'),
+    or_(
+        BackupTargetMountLedger.jobid == bindparam('jobid'),
+        BackupTargetMountLedger.mounted == True
+    )
+)
+_LEDGER_STATUS_STMT = select(BackupTargetMountLedger).where(
+    BackupTargetMountLedger.jobid == bindparam('jobid'),
+    BackupTargetMountLedger.backup_target_id == bindparam('backup_target_id')
+).limit(1)
+# Newest-first ledger entries for one target, soft-deleted ones included
+_LEDGER_HISTORY_STMT = select(BackupTargetMountLedger).where(
+    BackupTargetMountLedger.backup_target_id == bindparam('backup_target_id')
+).order_by(BackupTargetMountLedger.created_at.desc())
+
+
+_MANY = (list, tuple, set, frozenset)
+
+
+def _match(column, value):
+    """Equality for a single value, IN for a list of values
+
+    Values are compared as strings, so e.g. a UUID id matches its column.
+    IN lists are bound as one expanding parameter, so the statement is
+    compiled once regardless of the list length.
+    """
+    if isinstance(value, _MANY):
+        return column.in_([str(v) for v in value])
+    return column == str(value)
+
+
+# Database URLs whose schema this process has already ensured
+_schema_created = set()
+
+
+def _pool_options(db_url: str) -> Dict[str, Any]:
+    """Connection pool tuning for server databases
+
+    LIFO checkout keeps reusing the most recently returned (warm)
+    connection and lets idle extras time out. SQLite URLs keep
+    SQLAlchemy's default pool.
+    """
+    if db_url.startswith('sqlite'):
+        return {}
+    return {'pool_use_lifo': True, 'pool_recycle': 1800}
+
 
 # Exception classes for DMS Client
 class DMSClientError(Exception):
@@ -59,8 +122,13 @@ class DMSClient:
                  rabbitmq_url: Optional[str] = None,
                  timeout: Optional[int] = None,
                  lock_timeout: Optional[int] = None,
-                 lock_dir: Optional[str] = None):
-        """Initialize DMS Client"""
+                 lock_dir: Optional[str] = None,
+                 db_session: Optional[Session] = None):
+        """Initialize DMS Client
+
+        If db_session is given, all ledger access goes through that session
+        and its bind; the client neither creates the schema nor closes it.
+        """
         
         # Ensure client config is loaded
         from trilio_dms.config import DMSConfig
@@ -79,9 +147,19 @@ class DMSClient:
         logger.info("Lock manager initialized")
 
         # Setup database
+        self._db_session = db_session
         try:
-            self.engine = create_engine(self.db_url, pool_pre_ping=True)
-            Base.metadata.create_all(self.engine)
+            if db_session is not None:
+                self.engine = db_session.get_bind()
+            else:
+                self.engine = create_engine(
+                    self.db_url, pool_pre_ping=True, **_pool_options(self.db_url)
+                )
+                # Schema checks are one inspector query per table; do them
+                # once per database per process
+                if self.db_url not in _schema_created:
+                    Base.metadata.create_all(self.engine)
+                    _schema_created.add(self.db_url)
             self.SessionLocal = sessionmaker(bind=self.engine)
             logger.info("Database connection established")
         except Exception as e:
@@ -91,10 +169,27 @@ class DMSClient:
         self.connection = None
         self.channel = None
         self.callback_queue = None
-        self.response = None
-        self.corr_id = None
+        # Replies by correlation id; None until the reply arrives
+        self._pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._declared_queues = set()
         self._setup_rabbitmq()
 
+    @contextmanager
+    def _session(self, session: Optional[Session] = None) -> Iterator[Session]:
+        """Yield the caller's session, the injected one, or a new one
+
+        Only a session opened here is closed on exit.
+        """
+        db = session or self._db_session
+        if db is not None:
+            yield db
+            return
+        db = self.SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
     def _setup_rabbitmq(self):
         """Setup RabbitMQ connection"""
         try:
@@ -102,6 +197,7 @@ class DMSClient:
                 pika.URLParameters(self.rabbitmq_url)
             )
             self.channel = self.connection.channel()
+            self._declared_queues = set()
             result = self.channel.queue_declare(queue='', exclusive=True)
             self.callback_queue = result.method.queue
             self.channel.basic_consume(
@@ -115,15 +211,20 @@ class DMSClient:
 
     def _on_response(self, ch, method, props, body):
         """Handle response from DMS Server"""
-        if self.corr_id == props.correlation_id:
+        # Replies for requests no longer waited on (e.g. timed out) are dropped
+        if props.correlation_id in self._pending:
             try:
-                self.response = json.loads(body)
+                response = loads_message(body)
             except json.JSONDecodeError:
-                self.response = create_response('error', 'Invalid response format')
+                response = create_response('error', 'Invalid response format')
+            self._pending[props.correlation_id] = response
 
     def mount(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Mount with global locking"""
         request['action'] = 'mount'
+        error = self._check_request(request)
+        if error:
+            return error
         try:
             with self.lock_manager.acquire_lock("mount_unmount"):
                 return self._execute_mount_request(request)
@@ -134,6 +235,9 @@ class DMSClient:
     def unmount(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Unmount with smart logic and global locking"""
         request['action'] = 'unmount'
+        error = self._check_request(request)
+        if error:
+            return error
         try:
             with self.lock_manager.acquire_lock("mount_unmount"):
                 return self._execute_unmount_request(request)
@@ -141,288 +245,364 @@ class DMSClient:
             logger.error(f"Lock timeout for unmount: {e}")
             return create_response('error', f'Could not acquire lock: {e}')
 
-    def _execute_mount_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute mount with lock held"""
-        session = self.SessionLocal()
-        
+    def _check_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Validate a request before taking the lock; return an error response if invalid"""
         try:
             validate_request_structure(request)
+        except (RequestValidationException, ValueError, TypeError) as e:
+            logger.error(f"Validation failed: {e}")
+            return create_response('error', str(e))
+        return None
 
-            job_id = int(request['jobid'])
-            backup_target_id = request['backup_target']['id']
-            host = request['host']
-
-            logger.info(f"Mount - jobid={job_id}, target={backup_target_id}, host={host}")
-
-            # Check if already mounted for this job
-            existing = session.query(BackupTargetMountLedger).filter(
-                and_(
-                    BackupTargetMountLedger.jobid == job_id,
-                    BackupTargetMountLedger.backup_target_id == backup_target_id,
-                    BackupTargetMountLedger.host == host
-                )
-            ).first()
-
-            if existing and existing.mounted:
-                logger.info(f"Already mounted for jobid={job_id}, reusing")
-                # Get mount path from request body
-                mount_path = request['backup_target'].get('filesystem_export_mount_path')
-                
-                response = create_response(
-                    'success',
-                    success_msg='Target already mounted (reused existing)'
-                )
-                response['mount_path'] = mount_path
-                response['reused_existing'] = True
+    def _execute_mount_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute mount with lock held"""
+        with self._session() as session:
+            try:
+                job_id = int(request['jobid'])
+                backup_target = request['backup_target']
+                backup_target_id = backup_target['id']
+                host = request['host']
+                # Mount path comes from the request body
+                mount_path = backup_target.get('filesystem_export_mount_path')
+
+                logger.info(f"Mount - jobid={job_id}, target={backup_target_id}, host={host}")
+
+                # One query answers both: is this job's entry mounted, and
+                # does any other job hold the mount on this host
+                rows = session.execute(
+                    _MOUNT_CHECK_STMT,
+                    {'jobid': job_id, 'backup_target_id': backup_target_id, 'host': host}
+                ).scalars().all()
+                existing = next((row for row in rows if row.jobid == job_id), None)
+
+                if existing and existing.mounted:
+                    logger.info(f"Already mounted for jobid={job_id}, reusing")
+                    response = create_response(
+                        'success',
+                        success_msg='Target already mounted (reused existing)'
+                    )
+                    response['mount_path'] = mount_path
+                    response['reused_existing'] = True
                 
-                return response
+                    return response
 
-            # Check if mounted by other jobs
-            other_mounts = session.query(BackupTargetMountLedger).filter(
-                and_(
-                    BackupTargetMountLedger.backup_target_id == backup_target_id,
-                    BackupTargetMountLedger.host == host,
-                    BackupTargetMountLedger.mounted == True
-                )
-            ).first()
+                # Check if mounted by other jobs
+                other_mounts = any(row.mounted for row in rows if row is not existing)
 
-            physically_mounted = False
+                physically_mounted = False
             
-            if not other_mounts:
-                # Need to physically mount
-                logger.info("No existing mount. Sending mount request to DMS server")
-                response = self._send_request(request)
+                if not other_mounts:
+                    # Need to physically mount
+                    logger.info("No existing mount. Sending mount request to DMS server")
+                    response = self._send_request(request)
                 
-                if response['status'] != 'success':
-                    logger.error(f"Mount failed: {response.get('error_msg')}")
-                    return response
+                    if response['status'] != 'success':
+                        logger.error(f"Mount failed: {response.get('error_msg')}")
+                        return response
                 
-                physically_mounted = True
-                logger.info(f"Successfully mounted {backup_target_id} on {host}")
-            else:
-                logger.info("Reusing existing mount from another job")
-
-            # Create or update ledger
-            if existing:
-                existing.mounted = True
-                logger.debug(f"Updated ledger for jobid={job_id}")
-            else:
-                ledger = BackupTargetMountLedger(
-                    jobid=job_id,
-                    backup_target_id=backup_target_id,
-                    host=host,
-                    mounted=True
-                )
-                session.add(ledger)
-                logger.debug(f"Created ledger for jobid={job_id}")
+                    physically_mounted = True
+                    logger.info(f"Successfully mounted {backup_target_id} on {host}")
+                else:
+                    logger.info("Reusing existing mount from another job")
 
-            try:
-                session.commit()
-                logger.info(f"Ledger updated: jobid={job_id}, mounted=True")
-            except Exception as e:
-                session.rollback()
-                error_msg = str(e)
+                # Create or update ledger
+                if existing:
+                    existing.mounted = True
+                    logger.debug(f"Updated ledger for jobid={job_id}")
+                else:
+                    ledger = BackupTargetMountLedger(
+                        jobid=job_id,
+                        backup_target_id=backup_target_id,
+                        host=host,
+                        mounted=True
+                    )
+                    session.add(ledger)
+                    logger.debug(f"Created ledger for jobid={job_id}")
+
+                try:
+                    session.commit()
+                    logger.info(f"Ledger updated: jobid={job_id}, mounted=True")
+                except Exception as e:
+                    session.rollback()
+                    error_msg = str(e)
                 
-                # Handle foreign key constraint errors
-                if 'foreign key constraint' in error_msg.lower():
-                    if 'jobid' in error_msg.lower():
-                        logger.error(f"Job {job_id} does not exist in job table")
-                        return create_response(
-                            'error',
-                            f'Job {job_id} not found. Please ensure job exists before mounting.'
-                        )
-                    elif 'backup_target' in error_msg.lower():
-                        logger.error(f"Backup target {backup_target_id} does not exist")
-                        return create_response(
-                            'error',
-                            f'Backup target {backup_target_id} not found.'
-                        )
+                    # Handle foreign key constraint errors
+                    if 'foreign key constraint' in error_msg.lower():
+                        if 'jobid' in error_msg.lower():
+                            logger.error(f"Job {job_id} does not exist in job table")
+                            return create_response(
+                                'error',
+                                f'Job {job_id} not found. Please ensure job exists before mounting.'
+                            )
+                        elif 'backup_target' in error_msg.lower():
+                            logger.error(f"Backup target {backup_target_id} does not exist")
+                            return create_response(
+                                'error',
+                                f'Backup target {backup_target_id} not found.'
+                            )
                 
-                # Re-raise for other errors
-                raise
+                    # Re-raise for other errors
+                    raise
 
-            # Get mount path from request body
-            mount_path = request['backup_target'].get('filesystem_export_mount_path')
-            
-            response = create_response(
-                'success',
-                success_msg='Mount successful'
-            )
-            # Add additional fields to response
-            response['mount_path'] = mount_path
-            response['reused_existing'] = not physically_mounted
-            response['physically_mounted'] = physically_mounted
+                response = create_response(
+                    'success',
+                    success_msg='Mount successful'
+                )
+                # Add additional fields to response
+                response['mount_path'] = mount_path
+                response['reused_existing'] = not physically_mounted
+                response['physically_mounted'] = physically_mounted
             
-            return response
+                return response
 
-        except RequestValidationException as e:
-            logger.error(f"Validation failed: {e}")
-            return create_response('error', str(e))
-        except Exception as e:
-            logger.error(f"Mount failed: {e}", exc_info=True)
-            session.rollback()
-            return create_response('error', str(e))
-        finally:
-            session.close()
+            except Exception as e:
+                logger.error(f"Mount failed: {e}", exc_info=True)
+                session.rollback()
+                return create_response('error', str(e))
 
     def _execute_unmount_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Execute unmount with smart logic"""
-        session = self.SessionLocal()
-        
-        try:
-            validate_request_structure(request)
-
-            job_id = int(request['jobid'])
-            backup_target_id = request['backup_target']['id']
-            host = request['host']
-
-            logger.info(f"Unmount - jobid={job_id}, target={backup_target_id}, host={host}")
+        with self._session() as session:
+            try:
+                job_id = int(request['jobid'])
+                backup_target_id = request['backup_target']['id']
+                host = request['host']
+
+                logger.info(f"Unmount - jobid={job_id}, target={backup_target_id}, host={host}")
+
+                # Query active mounts
+                active_mounts = session.execute(
+                    _MOUNTED_ON_HOST_STMT,
+                    {'backup_target_id': backup_target_id, 'host': host}
+                ).scalars().all()
+
+                mount_count = len(active_mounts)
+                logger.info(f"Found {mount_count} active mount(s)")
+
+                # Find current job's entry
+                current_job_entry = None
+                for mount in active_mounts:
+                    if mount.jobid == job_id:
+                        current_job_entry = mount
+                        break
+
+                if not current_job_entry:
+                    logger.warning(f"No active mount found for jobid={job_id}")
+                    return create_response(
+                        'error',
+                        error_msg='No active mount found for this job',
+                        unmounted=False,
+                        active_mounts_remaining=mount_count
+                    )
 
-            # Query active mounts
-            active_mounts = session.query(BackupTargetMountLedger).filter(
-                and_(
-                    BackupTargetMountLedger.backup_target_id == backup_target_id,
-                    BackupTargetMountLedger.host == host,
-                    BackupTargetMountLedger.mounted == True
-                )
-            ).all()
+                physically_unmounted = False
 
-            mount_count = len(active_mounts)
-            logger.info(f"Found {mount_count} active mount(s)")
+                # Check if should physically unmount
+                if mount_count == 1:
+                    # Last mount - safe to unmount
+                    logger.info("Single active mount. Sending unmount to DMS server")
+                
+                    response = self._send_request(request)
+                
+                    if response['status'] != 'success':
+                        logger.error(f"Unmount failed: {response.get('error_msg')}")
+                        return response
+                
+                    physically_unmounted = True
+                    logger.info(f"Successfully unmounted {backup_target_id} on {host}")
+                else:
+                    # Multiple mounts - skip physical unmount
+                    logger.info(f"Multiple mounts ({mount_count}). Skipping physical unmount")
 
-            # Find current job's entry
-            current_job_entry = None
-            for mount in active_mounts:
-                if mount.jobid == job_id:
-                    current_job_entry = mount
-                    break
+                # Update ledger
+                current_job_entry.mounted = False
+                session.commit()
+                logger.info(f"Ledger updated: jobid={job_id}, mounted=False")
 
-            if not current_job_entry:
-                logger.warning(f"No active mount found for jobid={job_id}")
                 return create_response(
-                    'error',
-                    error_msg='No active mount found for this job',
-                    unmounted=False,
-                    active_mounts_remaining=mount_count
+                    'success',
+                    success_msg=(
+                        'Successfully unmounted' if physically_unmounted
+                        else 'Ledger updated, physical mount retained for other jobs'
+                    ),
+                    unmounted=physically_unmounted,
+                    active_mounts_remaining=mount_count - 1
                 )
 
-            physically_unmounted = False
-
-            # Check if should physically unmount
-            if mount_count == 1:
-                # Last mount - safe to unmount
-                logger.info("Single active mount. Sending unmount to DMS server")
-                
-                response = self._send_request(request)
-                
-                if response['status'] != 'success':
-                    logger.error(f"Unmount failed: {response.get('error_msg')}")
-                    return response
-                
-                physically_unmounted = True
-                logger.info(f"Successfully unmounted {backup_target_id} on {host}")
-            else:
-                # Multiple mounts - skip physical unmount
-                logger.info(f"Multiple mounts ({mount_count}). Skipping physical unmount")
-
-            # Update ledger
-            current_job_entry.mounted = False
-            session.commit()
-            logger.info(f"Ledger updated: jobid={job_id}, mounted=False")
-
-            return create_response(
-                'success',
-                success_msg=(
-                    'Successfully unmounted' if physically_unmounted
-                    else 'Ledger updated, physical mount retained for other jobs'
-                ),
-                unmounted=physically_unmounted,
-                active_mounts_remaining=mount_count - 1
-            )
-
-        except RequestValidationException as e:
-            logger.error(f"Validation failed: {e}")
-            return create_response('error', str(e))
-        except Exception as e:
-            logger.error(f"Unmount failed: {e}", exc_info=True)
-            session.rollback()
-            return create_response('error', str(e))
-        finally:
-            session.close()
+            except Exception as e:
+                logger.error(f"Unmount failed: {e}", exc_info=True)
+                session.rollback()
+                return create_response('error', str(e))
 
     def _send_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Send request to DMS Server via RabbitMQ"""
-        self.response = None
-        self.corr_id = str(uuid.uuid4())
+        corr_id = str(uuid.uuid4())
         queue_name = f"dms.{request['host']}"
 
         try:
-            self.channel.queue_declare(queue=queue_name, durable=True)
+            # Declaring is idempotent; only do the broker round trip once per
+            # queue on this channel
+            if queue_name not in self._declared_queues:
+                self.channel.queue_declare(queue=queue_name, durable=True)
+                self._declared_queues.add(queue_name)
             
+            self._pending[corr_id] = None
             self.channel.basic_publish(
                 exchange='',
                 routing_key=queue_name,
                 properties=pika.BasicProperties(
                     reply_to=self.callback_queue,
-                    correlation_id=self.corr_id,
+                    correlation_id=corr_id,
                     delivery_mode=2,
                     content_type='application/json'
                 ),
-                body=json.dumps(request)
+                body=dumps_message(request)
             )
 
-            logger.info(f"Sent {request.get('action')} to {queue_name}, corr_id={self.corr_id}")
+            logger.info(f"Sent {request.get('action')} to {queue_name}, corr_id={corr_id}")
 
-            # Wait for response
-            timeout_counter = 0
-            while self.response is None:
-                self.connection.process_data_events(time_limit=1)
-                timeout_counter += 1
-                if timeout_counter > self.timeout:
+            # Wait for response; process_data_events returns as soon as the
+            # reply is dispatched, so block for whatever time is left
+            deadline = time.monotonic() + self.timeout
+            while self._pending[corr_id] is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
                     raise RequestTimeoutException(f"Timeout after {self.timeout}s")
+                self.connection.process_data_events(time_limit=remaining)
 
-            logger.info(f"Received response: {self.response.get('status')}")
-            return self.response
+            response = self._pending[corr_id]
+            logger.info(f"Received response: {response.get('status')}")
+            return response
 
         except RequestTimeoutException:
             raise
         except Exception as e:
             raise RabbitMQException(f"Failed to send request: {e}")
-
-    def get_mount_status(self, job_id: int, backup_target_id: str) -> Optional[BackupTargetMountLedger]:
-        """Get mount status"""
-        session = self.SessionLocal()
-        try:
-            return session.query(BackupTargetMountLedger).filter(
-                and_(
-                    BackupTargetMountLedger.jobid == job_id,
-                    BackupTargetMountLedger.backup_target_id == backup_target_id
-                )
-            ).first()
-        except Exception as e:
-            logger.error(f"Failed to get status: {e}")
-            return None
         finally:
-            session.close()
+            self._pending.pop(corr_id, None)
 
-    def get_active_mounts(self, host: Optional[str] = None,
-                         backup_target_id: Optional[str] = None) -> List[BackupTargetMountLedger]:
-        """Get all active mounts"""
-        session = self.SessionLocal()
-        try:
-            query = session.query(BackupTargetMountLedger).filter(
-                BackupTargetMountLedger.mounted == True
-            )
-            if host:
-                query = query.filter(BackupTargetMountLedger.host == host)
-            if backup_target_id:
-                query = query.filter(BackupTargetMountLedger.backup_target_id == backup_target_id)
-            return query.all()
-        except Exception as e:
-            logger.error(f"Failed to get active mounts: {e}")
+    def get_mount_status(self, job_id: int, backup_target_id: str,
+                         session: Optional[Session] = None) -> Optional[BackupTargetMountLedger]:
+        """Get mount status
+
+        A caller-supplied session is used as-is and left open.
+        """
+        with self._session(session) as db:
+            try:
+                return db.execute(
+                    _LEDGER_STATUS_STMT,
+                    {'jobid': job_id, 'backup_target_id': backup_target_id}
+                ).scalars().first()
+            except Exception as e:
+                logger.error(f"Failed to get status: {e}")
+                return None
+
+    def get_active_mounts(self, host: Union[str, Sequence[str], None] = None,
+                         backup_target_id: Union[str, Sequence[str], None] = None,
+                         session: Optional[Session] = None,
+                         limit: Optional[int] = None) -> List[BackupTargetMountLedger]:
+        """Get all active mounts, or the newest limit of them
+
+        host and backup_target_id each take a single value or a list of
+        values, so mounts for many hosts/targets come back in one query.
+        None or an empty string means no filter; an empty list matches
+        nothing. A caller-supplied session is used as-is and left open.
+        """
+        # An empty list cannot match any row; skip the query
+        if any(isinstance(value, _MANY) and not value
+               for value in (host, backup_target_id)):
             return []
-        finally:
-            session.close()
+        filters = [
+            _match(column, value)
+            for column, value in (
+                (BackupTargetMountLedger.host, host),
+                (BackupTargetMountLedger.backup_target_id, backup_target_id),
+            )
+            if value
+        ]
+
+        with self._session(session) as db:
+            try:
+                stmt = _ACTIVE_MOUNTS_STMT.where(*filters)
+                if limit:
+                    # Newest first, ties broken by primary key, so a limited
+                    # listing is a stable subset
+                    stmt = stmt.order_by(
+                        BackupTargetMountLedger.created_at.desc(),
+                        BackupTargetMountLedger.jobid,
+                        BackupTargetMountLedger.backup_target_id,
+                        BackupTargetMountLedger.host
+                    ).limit(limit)
+                return db.execute(stmt).scalars().all()
+            except Exception as e:
+                logger.error(f"Failed to get active mounts: {e}")
+                return []
+
+    def get_ledger_history(self, backup_target_id: str, limit: int = 100,
+                           session: Optional[Session] = None) -> List[BackupTargetMountLedger]:
+        """Get the most recent ledger entries for a target, newest first
+
+        A caller-supplied session is used as-is and left open.
+        """
+        with self._session(session) as db:
+            try:
+                return db.execute(
+                    _LEDGER_HISTORY_STMT.limit(limit),
+                    {'backup_target_id': backup_target_id}
+                ).scalars().all()
+            except Exception as e:
+                logger.error(f"Failed to get ledger history: {e}")
+                return []
+
+    def stream_ledger_history(self, backup_target_id: str,
+                              limit: Optional[int] = None,
+                              session: Optional[Session] = None,
+                              batch_size: int = 200) -> Iterator[BackupTargetMountLedger]:
+        """Yield ledger entries for a target, newest first, batch_size rows at a time
+
+        Rows are fetched lazily (server-side cursor where the driver
+        supports it), so memory stays flat for long histories. The
+        session stays open until the generator is exhausted or closed.
+        """
+        stmt = _LEDGER_HISTORY_STMT.execution_options(yield_per=batch_size)
+        if limit:
+            stmt = stmt.limit(limit)
+        with self._session(session) as db:
+            yield from db.execute(
+                stmt, {'backup_target_id': backup_target_id}
+            ).scalars()
+
+    def cleanup_stale_entries(self, hours: int = 24,
+                              session: Optional[Session] = None) -> int:
+        """Soft-delete unmounted ledger entries older than the given age
+
+        Runs as a single UPDATE. A caller-supplied session is used as-is
+        and left open.
+
+        Returns:
+            Number of entries marked deleted
+        """
+        now = datetime.utcnow()
+        cutoff = now - timedelta(hours=hours)
+        with self._session(session) as db:
+            try:
+                count = db.query(BackupTargetMountLedger).filter(
+                    BackupTargetMountLedger.mounted == False,
+                    BackupTargetMountLedger.created_at < cutoff,
+                    BackupTargetMountLedger.deleted == False
+                ).update(
+                    {
+                        BackupTargetMountLedger.deleted: True,
+                        BackupTargetMountLedger.deleted_at: now
+                    },
+                    synchronize_session=False
+                )
+                db.commit()
+                logger.info(f"Marked {count} stale ledger entries deleted")
+                return count
+            except Exception as e:
+                db.rollback()
+                raise DatabaseException(f"Failed to clean up stale entries: {e}")
 
     def close(self):
         """Close connections"""
@@ -432,7 +612,7 @@ class DMSClient:
                 logger.info("RabbitMQ closed")
             except Exception as e:
                 logger.warning(f"Error closing RabbitMQ: {e}")
-        if self.engine:
+        if self.engine and self._db_session is None:
             try:
                 self.engine.dispose()
                 logger.info("Database closed")
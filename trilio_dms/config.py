@@ -8,6 +8,7 @@ Supports loading from:
 
 import os
 import logging
+from functools import lru_cache
 from configparser import ConfigParser
 from typing import Dict, Any, Optional
 
@@ -260,9 +261,10 @@ class DMSConfig:
         
         logger.info("Client configuration validated successfully")
     
-    @classmethod
-    def _mask_password(cls, url: str) -> str:
-        """Mask password in URL for logging."""
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _mask_password(url: str) -> str:
+        """Mask password in URL for logging (cached per URL)."""
         if '@' in url and '://' in url:
             try:
                 protocol, rest = url.split('://', 1)
@@ -288,17 +290,20 @@ class DMSConfig:
         if not cls._loaded:
             cls.load_config()
         
-        print("="*60)
-        print("DMS Configuration")
-        print("="*60)
-        print(f"RABBITMQ_URL: {cls._mask_password(cls.RABBITMQ_URL)}")
-        print(f"DB_URL: {cls._mask_password(cls.DB_URL)}")
-        print(f"NODE_ID: {cls.NODE_ID}")
-        print(f"AUTH_URL: {cls.AUTH_URL}")
-        print(f"MOUNT_BASE_PATH: {cls.MOUNT_BASE_PATH}")
-        print(f"LOG_LEVEL: {cls.LOG_LEVEL}")
-        print(f"REQUEST_TIMEOUT: {cls.REQUEST_TIMEOUT}")
-        print("="*60)
+        rule = "="*60
+        print("\n".join((
+            rule,
+            "DMS Configuration",
+            rule,
+            f"RABBITMQ_URL: {cls._mask_password(cls.RABBITMQ_URL)}",
+            f"DB_URL: {cls._mask_password(cls.DB_URL)}",
+            f"NODE_ID: {cls.NODE_ID}",
+            f"AUTH_URL: {cls.AUTH_URL}",
+            f"MOUNT_BASE_PATH: {cls.MOUNT_BASE_PATH}",
+            f"LOG_LEVEL: {cls.LOG_LEVEL}",
+            f"REQUEST_TIMEOUT: {cls.REQUEST_TIMEOUT}",
+            rule,
+        )))
 
 
 # Auto-load configuration on module import
@@ -40,8 +40,23 @@ class BackupTargetMountLedger(Base):
         PrimaryKeyConstraint('jobid', 'backup_target_id', 'host', name='pk_mount_ledger'),
         Index('idx_target_host_mounted', 'backup_target_id', 'host', 'mounted'),
         Index('idx_jobid', 'jobid'),
+        Index('idx_mounted_created', 'mounted', 'created_at'),
     )
     
+    def to_dict(self):
+        """Return the ledger entry as a dict; datetimes are left as-is"""
+        return {
+            'jobid': self.jobid,
+            'backup_target_id': self.backup_target_id,
+            'host': self.host,
+            'mounted': self.mounted,
+            'deleted': self.deleted,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'deleted_at': self.deleted_at,
+            'version': self.version,
+        }
+
     def __repr__(self):
         return (
             f"<BackupTargetMountLedger("
@@ -5,6 +5,7 @@ Tracks processes in memory AND persists PID files to disk
 """
 
 import os
+import re
 import logging
 import subprocess
 import signal
@@ -17,6 +18,10 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Environment keys whose values are redacted from debug logs
+_SENSITIVE_ENV_RE = re.compile(
+    'AWS_ACCESS_KEY_ID|AWS_SECRET_ACCESS_KEY|aws_secret_access_key')
+
 
 class S3VaultFuseManager:
     """
@@ -92,13 +97,25 @@ class S3VaultFuseManager:
             True if successful
         """
         pid_file = self._get_pid_file_path(target_id)
+        # Write to a temp name and rename, so readers never see a partial
+        # file; the .tmp suffix keeps it out of _load_existing_pids
+        tmp_file = f"{pid_file}.tmp"
         try:
-            with open(pid_file, 'w') as f:
-                f.write(str(pid))
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, str(pid).encode())
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, pid_file)
             logger.info(f"✓ PID file written: {pid_file} (PID: {pid})")
             return True
         except Exception as e:
             logger.error(f"Failed to write PID file {pid_file}: {e}")
+            # Don't leave a partial temp file behind for the next write
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
             return False
     
     def _read_pid_file(self, target_id: str) -> Optional[int]:
@@ -697,10 +714,9 @@ class S3VaultFuseManager:
             Sanitized environment dictionary
         """
         sanitized = {}
-        sensitive_keys = ['AWS_ACCESS_KEY_ID', 'AWS_SECRET_ACCESS_KEY', 'aws_secret_access_key']
         
         for key, value in env.items():
-            if any(sensitive in key for sensitive in sensitive_keys):
+            if _SENSITIVE_ENV_RE.search(key):
                 sanitized[key] = '***REDACTED***'
             else:
                 sanitized[key] = value
@@ -22,8 +22,9 @@ from trilio_dms.exceptions import (
     SecretFetchException
 )
 from trilio_dms.utils import (
-    create_response, is_mounted, get_mount_path,
-    ensure_directory, run_command, sanitize_mount_options
+    create_response, is_mounted, is_mount_stale, get_mount_path,
+    ensure_directory, run_command, sanitize_mount_options,
+    dumps_message, loads_message
 )
 
 logging.basicConfig(
@@ -103,6 +104,10 @@ class DMSServer:
         elif hasattr(self.s3vaultfuse_manager, 'S3VAULTFUSE_BIN'):
             self.s3vaultfuse_manager.S3VAULTFUSE_BIN = s3fuse_bin
 
+        # Barbican HTTP session, kept alive across the metadata/payload
+        # fetches and across requests
+        self.http = requests.Session()
+
         # Note: Mount base directory creation removed
         # S3 mounts will be created by s3vaultfuse itself
         # NFS mounts will be created on-demand during mount operation
@@ -139,6 +144,7 @@ class DMSServer:
         except KeyboardInterrupt:
             logger.info("Shutting down DMS Server...")
             self.s3vaultfuse_manager.cleanup_all()
+            self.http.close()
             if connection and not connection.is_closed:
                 connection.close()
         except Exception as e:
@@ -148,7 +154,7 @@ class DMSServer:
     def _handle_request(self, ch, method, properties, body):
         """Handle incoming mount/unmount requests"""
         try:
-            request = json.loads(body)
+            request = loads_message(body)
             action = request.get('action', 'unknown')
             target_id = request.get('backup_target', {}).get('id', 'unknown')
 
@@ -173,7 +179,7 @@ class DMSServer:
                         correlation_id=properties.correlation_id,
                         content_type='application/json'
                     ),
-                    body=json.dumps(response)
+                    body=dumps_message(response)
                 )
                 logger.info(f"Sent response for {action} request: {response['status']}")
 
@@ -202,7 +208,7 @@ class DMSServer:
                         correlation_id=properties.correlation_id,
                         content_type='application/json'
                     ),
-                    body=json.dumps(response)
+                    body=dumps_message(response)
                 )
             except Exception as e:
                 logger.error(f"Failed to send error response: {e}")
@@ -258,6 +264,12 @@ class DMSServer:
             # NOTE: Do NOT create mount directory for S3
             # s3vaultfuse will create it if needed
 
+            # A dead mount is not "already mounted"; clear it and remount
+            if is_mount_stale(mount_path):
+                error = self._release_stale_mount(target_id, 's3', mount_path)
+                if error:
+                    return create_response('error', error)
+
             # Check if already mounted
             if is_mounted(mount_path):
                 logger.info(f"Target {target_id} already mounted at {mount_path}")
@@ -307,6 +319,12 @@ class DMSServer:
             # Sanitize mount options
             mount_opts = sanitize_mount_options(mount_opts)
 
+            # A dead mount is not "already mounted"; clear it and remount
+            if is_mount_stale(mount_path):
+                error = self._release_stale_mount(target_id, 'nfs', mount_path)
+                if error:
+                    return create_response('error', error)
+
             # Create mount directory
             if not ensure_directory(mount_path):
                 return create_response('error', f'Failed to create mount directory: {mount_path}')
@@ -350,6 +368,33 @@ class DMSServer:
             logger.error(f"NFS mount failed: {e}", exc_info=True)
             return create_response('error', f'NFS mount error: {e}')
 
+    def _release_stale_mount(self, target_id: str, target_type: str,
+                             mount_path: str) -> Optional[str]:
+        """
+        Detach a dead mount so the target can be mounted again
+
+        Args:
+            target_id: Backup target ID
+            target_type: 's3' or 'nfs'
+            mount_path: Stale mountpoint
+
+        Returns:
+            None on success, otherwise an error message
+        """
+        logger.warning(f"Target {target_id} has a stale mount at {mount_path}, remounting")
+
+        if target_type == 's3':
+            self.s3vaultfuse_manager.kill_s3vaultfuse(target_id)
+
+        # Lazy unmount: a regular one blocks or fails on a dead FUSE/NFS mount
+        returncode, stdout, stderr = run_command(
+            ['sudo', self.rootwrap_bin, self.rootwrap_conf, 'umount', '-l', mount_path],
+            timeout=30
+        )
+        if returncode != 0:
+            return f'Stale mount at {mount_path} could not be unmounted: {stderr}'
+        return None
+
     def _handle_unmount(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle unmount request"""
         try:
@@ -437,7 +482,7 @@ class DMSServer:
                 'Accept': 'application/json'
             }
             logger.debug(f"Fetching secret metadata from: {secret_ref}")
-            response = requests.get(
+            response = self.http.get(
                 secret_ref,
                 headers=headers,
                 verify=False,
@@ -474,8 +519,8 @@ class DMSServer:
 
             payload_url = f"{secret_ref}/payload"
             logger.debug(f"Fetching payload from: {payload_url}")
-            payload_response = requests.get(payload_url, verify=False, headers=headers, timeout=30)
-            response.raise_for_status()
+            payload_response = self.http.get(payload_url, verify=False, headers=headers, timeout=30)
+            payload_response.raise_for_status()
 
             payload_text = payload_response.text
             logger.debug(f"Raw payload (first 100 chars): {payload_text[:100]}")
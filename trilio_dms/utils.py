@@ -5,11 +5,28 @@ Utility functions for Trilio DMS
 import json
 import logging
 import os
+import re
 import subprocess
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Set
+
+from trilio_dms.exceptions import RequestValidationException
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up RabbitMQ message (de)serialization
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = ('context', 'keystone_token', 'jobid', 'host', 'action', 'backup_target')
+_TARGET_FIELDS = ('id', 'type', 'status', 'filesystem_export', 'filesystem_export_mount_path',
+                  'secret_ref', 'nfs_mount_opts')
+_VALID_ACTIONS = frozenset(('mount', 'unmount'))
+_VALID_TARGET_TYPES = frozenset(('s3', 'nfs'))
+
+_PROC_MOUNTS = '/proc/mounts'
+_MOUNT_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
 
 def validate_request_structure(request: Dict[str, Any]) -> bool:
     """
@@ -24,9 +41,7 @@ def validate_request_structure(request: Dict[str, Any]) -> bool:
     Raises:
         ValueError if invalid
     """
-    required_fields = ['context', 'keystone_token', 'jobid', 'host', 'action', 'backup_target']
-    
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in request:
             raise ValueError(f"Missing required field: {field}")
     
@@ -37,18 +52,18 @@ def validate_request_structure(request: Dict[str, Any]) -> bool:
     #        raise ValueError(f"Missing required job field: {field}")
     
     # Validate backup_target structure
-    target_fields = ['id', 'type', 'status', 'filesystem_export', 'filesystem_export_mount_path', 'secret_ref', 'nfs_mount_opts']
-    for field in target_fields:
-        if field not in request['backup_target']:
+    backup_target = request['backup_target']
+    for field in _TARGET_FIELDS:
+        if field not in backup_target:
             raise ValueError(f"Missing required backup_target field: {field}")
     
     # Validate action
-    if request['action'] not in ['mount', 'unmount']:
+    if request['action'] not in _VALID_ACTIONS:
         raise ValueError(f"Invalid action: {request['action']}. Must be 'mount' or 'unmount'")
     
     # Validate backup target type
-    if request['backup_target']['type'] not in ['s3', 'nfs']:
-        raise ValueError(f"Invalid backup target type: {request['backup_target']['type']}")
+    if backup_target['type'] not in _VALID_TARGET_TYPES:
+        raise ValueError(f"Invalid backup target type: {backup_target['type']}")
 
     # Validate jobid is integer
     try:
@@ -79,6 +94,28 @@ def create_response(status: str, error_msg: Optional[str] = None,
     }
 
 
+def _unescape_mount_field(field: str) -> str:
+    """Decode the octal escapes (\\040 etc.) used in /proc/mounts fields"""
+    return _MOUNT_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), field)
+
+
+def _read_mountpoints() -> Optional[Set[str]]:
+    """
+    Read the current mountpoints from /proc/mounts in one pass
+    
+    Returns:
+        Set of mountpoint paths, or None if /proc/mounts is unavailable
+    """
+    try:
+        with open(_PROC_MOUNTS, 'r') as f:
+            return {
+                _unescape_mount_field(line.split(' ', 2)[1])
+                for line in f if line.count(' ') >= 2
+            }
+    except OSError:
+        return None
+
+
 def is_mounted(mount_path: str) -> bool:
     """
     Check if a path is mounted
@@ -89,8 +126,18 @@ def is_mounted(mount_path: str) -> bool:
     Returns:
         True if mounted, False otherwise
     """
-    if not os.path.exists(mount_path):
+    # lstat, not exists(): a dead FUSE/NFS mount raises ENOTCONN/ESTALE
+    # rather than ENOENT, and must still be reported as mounted
+    try:
+        os.lstat(mount_path)
+    except FileNotFoundError:
         return False
+    except OSError:
+        pass
+    
+    mountpoints = _read_mountpoints()
+    if mountpoints is not None:
+        return os.path.realpath(mount_path) in mountpoints
     
     result = subprocess.run(
         ['mountpoint', '-q', mount_path],
@@ -99,6 +146,32 @@ def is_mounted(mount_path: str) -> bool:
     return result.returncode == 0
 
 
+def is_mount_stale(mount_path: str) -> bool:
+    """
+    Check if a path is a dead mountpoint
+    
+    A crashed s3vaultfuse or an unreachable NFS server leaves the
+    mountpoint in place but every stat on it fails (ENOTCONN, ESTALE,
+    EIO...). is_mounted() still reports such a path as mounted so it can
+    be unmounted; callers about to mount use this to tell it apart from
+    a healthy mount.
+    
+    Args:
+        mount_path: Path to check
+        
+    Returns:
+        True if the path exists but cannot be stat'ed, False otherwise
+    """
+    try:
+        os.lstat(mount_path)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        logger.warning(f"Stale mount at {mount_path}: {e}")
+        return True
+    return False
+
+
 def get_mount_path(mount_base: str, target_id: str) -> str:
     """
     Get mount path for a backup target
@@ -155,6 +228,39 @@ def safe_json_dumps(obj: Any, default: str = '{}') -> str:
         return default
 
 
+def dumps_message(obj: Any) -> bytes:
+    """
+    Serialize a RabbitMQ message body
+    
+    Args:
+        obj: Request or response dictionary
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def loads_message(body: Any) -> Any:
+    """
+    Parse a RabbitMQ message body
+    
+    Args:
+        body: JSON as bytes or str
+        
+    Returns:
+        Parsed message
+        
+    Raises:
+        json.JSONDecodeError if the body is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
 def ensure_directory(path: str, mode: int = 0o755) -> bool:
     """
     Ensure directory exists
@@ -3,16 +3,16 @@
 # Copyright (c) 2013 TrilioData, Inc.
 # All Rights Reserved.
 
-import pkg_resources
+from importlib import metadata as importlib_metadata
 
 WORKLOADMGR_VENDOR = "TrilioData Inc."
 WORKLOADMGR_PRODUCT = "TrilioData Inc."
 
 def version_string():
     try:
-        return pkg_resources.get_distribution("trilio-dms").version
+        return importlib_metadata.version("trilio-dms")
     except Exception as ex:
         try:
-            return pkg_resources.get_distribution("python3-trilio-dms-el9").version
+            return importlib_metadata.version("python3-trilio-dms-el9")
         except Exception as ex:
             return '1.0.0'